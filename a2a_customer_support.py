@@ -3,6 +3,7 @@ import pandas as pd
 import re
 import time
 from datetime import datetime
+from ticket_store import TicketStore
 
 # Agent class - Base class for all agents
 class Agent:
@@ -203,9 +204,12 @@ class OrchestratorAgent(Agent):
         for status, count in status_counts.items():
             print(f"  - {status}: {count} tickets")
         
-        # Save processed data
-        processed_data.to_csv('processed_customer_data.csv', index=False)
-        print("\nProcessed data saved to 'processed_customer_data.csv'")
+        # Save processed data (upserts per ticket, no full-file rewrite).
+        # Each run replaces the previous one: tickets not in this batch are
+        # pruned, since priorities are only comparable within a single run.
+        store = TicketStore()
+        saved = store.upsert_dataframe(processed_data, prune=True)
+        print(f"\nProcessed data saved to '{store.db_path}' ({saved} tickets upserted)")
 
 # Main function to run the A2A system
 def run_a2a_system(csv_path):
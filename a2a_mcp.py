@@ -1,10 +1,9 @@
-import pandas as pd
 import flask
 from flask import Flask, request, jsonify, render_template_string
 import json
-import os
 import sys
 from a2a_customer_support import run_a2a_system
+from ticket_store import TicketStore
 
 app = Flask(__name__)
 
@@ -192,29 +191,50 @@ HTML_TEMPLATE = """
     </div>
 
     <script>
-        // Global variable to store all tickets data
-        let allTickets = [];
+        // Function to build query params from the current filter selection
+        function filterParams() {
+            const params = new URLSearchParams();
+            const filters = {
+                priority: document.getElementById('priorityFilter').value,
+                status: document.getElementById('statusFilter').value,
+                category: document.getElementById('categoryFilter').value
+            };
+            for (const [key, value] of Object.entries(filters)) {
+                if (value !== 'all') params.append(key, value);
+            }
+            return params.toString();
+        }
         
-        // Function to fetch ticket data from the API
+        // Function to fetch ticket data and stats from the API
         async function fetchTicketData() {
+            const query = filterParams();
             try {
-                const response = await fetch('/api/tickets');
-                const data = await response.json();
-                allTickets = data;
-                updateStats(data);
-                displayTickets(data);
+                const [ticketsResponse, statsResponse] = await Promise.all([
+                    fetch(`/api/tickets?${query}`),
+                    fetch(`/api/stats?${query}`)
+                ]);
+                const tickets = await ticketsResponse.json();
+                const stats = await statsResponse.json();
+                updateStats(stats);
+                displayTickets(tickets);
             } catch (error) {
                 console.error('Error fetching ticket data:', error);
                 document.getElementById('ticketsContainer').innerHTML = '<p>Error loading ticket data. Please try again.</p>';
             }
         }
         
+        // Function to look up a count in a list of {value, count} pairs
+        function countOf(pairs, value) {
+            const match = pairs.find(p => p.value === value);
+            return match ? match.count : 0;
+        }
+        
         // Function to update stats counters
-        function updateStats(tickets) {
-            document.getElementById('ticketCount').textContent = tickets.length;
-            document.getElementById('highPriorityCount').textContent = tickets.filter(t => t.Priority === 'High').length;
-            document.getElementById('openCount').textContent = tickets.filter(t => t.Status === 'Open').length;
-            document.getElementById('resolvedCount').textContent = tickets.filter(t => t.Status === 'Resolved').length;
+        function updateStats(stats) {
+            document.getElementById('ticketCount').textContent = stats.total;
+            document.getElementById('highPriorityCount').textContent = countOf(stats.by_priority, 'High');
+            document.getElementById('openCount').textContent = countOf(stats.by_status, 'Open');
+            document.getElementById('resolvedCount').textContent = countOf(stats.by_status, 'Resolved');
         }
         
         // Function to display tickets in the container
@@ -253,42 +273,18 @@ HTML_TEMPLATE = """
             container.innerHTML = html;
         }
         
-        // Function to apply filters to ticket data
-        function applyFilters() {
-            const priorityFilter = document.getElementById('priorityFilter').value;
-            const statusFilter = document.getElementById('statusFilter').value;
-            const categoryFilter = document.getElementById('categoryFilter').value;
-            
-            let filteredTickets = [...allTickets];
-            
-            if (priorityFilter !== 'all') {
-                filteredTickets = filteredTickets.filter(ticket => ticket.Priority === priorityFilter);
-            }
-            
-            if (statusFilter !== 'all') {
-                filteredTickets = filteredTickets.filter(ticket => ticket.Status === statusFilter);
-            }
-            
-            if (categoryFilter !== 'all') {
-                filteredTickets = filteredTickets.filter(ticket => ticket.Category === categoryFilter);
-            }
-            
-            updateStats(filteredTickets);
-            displayTickets(filteredTickets);
-        }
-        
         // Attach event listeners after DOM is loaded
         document.addEventListener('DOMContentLoaded', () => {
             fetchTicketData();
             
-            document.getElementById('applyFilters').addEventListener('click', applyFilters);
+            // Filtering runs server-side against the indexed ticket store
+            document.getElementById('applyFilters').addEventListener('click', fetchTicketData);
             
             document.getElementById('resetFilters').addEventListener('click', () => {
                 document.getElementById('priorityFilter').value = 'all';
                 document.getElementById('statusFilter').value = 'all';
                 document.getElementById('categoryFilter').value = 'all';
-                updateStats(allTickets);
-                displayTickets(allTickets);
+                fetchTicketData();
             });
             
             document.getElementById('refreshData').addEventListener('click', fetchTicketData);
@@ -307,14 +303,37 @@ def index():
 @app.route('/api/tickets')
 def get_tickets():
     try:
-        # Read processed data CSV file
-        df = pd.read_csv('processed_customer_data.csv')
-        # Convert to list of dictionaries for JSON response
-        tickets = df.to_dict('records')
+        # Query processed tickets, optionally filtered on indexed columns
+        tickets = TicketStore().query_tickets(
+            status=request.args.get('status'),
+            priority=request.args.get('priority'),
+            category=request.args.get('category'),
+        )
         return jsonify(tickets)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# API route to get aggregate ticket counts for the dashboard
+@app.route('/api/stats')
+def get_stats():
+    try:
+        # Aggregates honour the same filters as /api/tickets
+        filters = {
+            "status": request.args.get('status'),
+            "priority": request.args.get('priority'),
+            "category": request.args.get('category'),
+        }
+        store = TicketStore()
+        stats = {
+            "total": store.count(**filters),
+            "by_status": store.count_by('Status', **filters),
+            "by_priority": store.count_by('Priority', **filters),
+            "by_category": store.count_by('Category', **filters),
+        }
+        return jsonify(stats)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 # API route to process data (runs A2A system on demand)
 @app.route('/api/process', methods=['POST'])
 def process_data():
@@ -333,7 +352,7 @@ def start_mcp_server(host='127.0.0.1', port=5000, debug=True):
 
 if __name__ == "__main__":
     # Check if processed data exists, if not process it
-    if not os.path.exists('processed_customer_data.csv'):
+    if TicketStore().count() == 0:
         print("🔄 Processed data not found. Running A2A system first...")
         run_a2a_system('customer_support_data.csv')
     
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ticket_store import TicketStore
+
+
+def make_ticket(ticket_id, status='Open', priority='High', category='Billing'):
+    return {
+        'Ticket ID': ticket_id,
+        'Customer Name': 'Jane Doe',
+        'Email': 'jane@example.com',
+        'Issue Description': 'Payment failed',
+        'Status': status,
+        'Created At': pd.Timestamp('2024-01-01 09:30:00'),
+        'Category': category,
+        'Days Open': 3.5,
+        'Priority Score': 7.0,
+        'Priority': priority,
+        'Suggested Response': 'We are on it.',
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TicketStore(str(tmp_path / 'tickets.db'))
+
+
+def test_upsert_updates_existing_ticket(store):
+    store.upsert_ticket(make_ticket(1, status='Open'))
+    store.upsert_ticket(make_ticket(1, status='Resolved'))
+
+    tickets = store.query_tickets()
+    assert len(tickets) == 1
+    assert tickets[0]['Status'] == 'Resolved'
+    # Integer IDs keep their type
+    assert tickets[0]['Ticket ID'] == 1
+
+
+def test_upsert_skips_tickets_without_id(store):
+    saved = store.upsert_tickets([{'Status': 'x'}, {'Ticket ID': np.nan, 'Status': 'y'}])
+    assert saved == 0
+    assert store.count() == 0
+
+
+def test_prune_removes_tickets_missing_from_batch(store):
+    store.upsert_tickets([make_ticket('T1'), make_ticket('T2')])
+    store.upsert_tickets([make_ticket('T2'), make_ticket('T3')], prune=True)
+
+    assert sorted(t['Ticket ID'] for t in store.query_tickets()) == ['T2', 'T3']
+
+
+def test_query_tickets_filters(store):
+    store.upsert_tickets([
+        make_ticket('T1', status='Open', priority='High', category='Billing'),
+        make_ticket('T2', status='Open', priority='Low', category='Technical'),
+        make_ticket('T3', status='Resolved', priority='High', category='Billing'),
+    ])
+
+    assert {t['Ticket ID'] for t in store.query_tickets(status='Open')} == {'T1', 'T2'}
+    assert {t['Ticket ID'] for t in store.query_tickets(priority='High')} == {'T1', 'T3'}
+    assert {t['Ticket ID'] for t in store.query_tickets(status='Open', category='Billing')} == {'T1'}
+    assert store.query_tickets(category='Shipping') == []
+
+
+def test_count_by_groups_and_labels_missing_values(store):
+    store.upsert_tickets([
+        make_ticket('T1', status='Open'),
+        make_ticket('T2', status='Open'),
+        make_ticket('T3', status=None),
+    ])
+
+    assert store.count_by('Status') == [
+        {'value': 'Open', 'count': 2},
+        {'value': 'Unknown', 'count': 1},
+    ]
+
+
+def test_count_by_rejects_unindexed_column(store):
+    with pytest.raises(ValueError):
+        store.count_by('Email')
+
+
+def test_to_db_value_conversions():
+    assert TicketStore._to_db_value(pd.Timestamp('2024-01-01 09:30:00')) == '2024-01-01 09:30:00'
+    assert TicketStore._to_db_value(np.nan) is None
+    assert TicketStore._to_db_value(None) is None
+    value = TicketStore._to_db_value(np.int64(5))
+    assert value == 5 and type(value) is int
+    value = TicketStore._to_db_value(np.float64(2.5))
+    assert value == 2.5 and type(value) is float
+    assert TicketStore._to_db_value('Open') == 'Open'
@@ -0,0 +1,164 @@
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+
+# Default location of the processed ticket database
+DEFAULT_DB_PATH = 'processed_customer_data.db'
+
+# Mapping between DataFrame column names and database column names
+COLUMNS = {
+    'Ticket ID': 'ticket_id',
+    'Customer Name': 'customer_name',
+    'Email': 'email',
+    'Issue Description': 'issue_description',
+    'Status': 'status',
+    'Created At': 'created_at',
+    'Category': 'category',
+    'Days Open': 'days_open',
+    'Priority Score': 'priority_score',
+    'Priority': 'priority',
+    'Suggested Response': 'suggested_response',
+}
+
+# Columns that can be used for filtering and grouping (all indexed)
+INDEXED_COLUMNS = {
+    'Status': 'status',
+    'Priority': 'priority',
+    'Category': 'category',
+    'Created At': 'created_at',
+}
+
+# Label used in aggregates for tickets with no value in the grouped column
+UNKNOWN_LABEL = 'Unknown'
+
+# ticket_id is declared without a type so integer IDs come back as integers,
+# just like they did when round-tripping through the old CSV file
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    ticket_id NOT NULL PRIMARY KEY,
+    customer_name TEXT,
+    email TEXT,
+    issue_description TEXT,
+    status TEXT,
+    created_at TEXT,
+    category TEXT,
+    days_open REAL,
+    priority_score REAL,
+    priority TEXT,
+    suggested_response TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets (status);
+CREATE INDEX IF NOT EXISTS idx_tickets_priority ON tickets (priority);
+CREATE INDEX IF NOT EXISTS idx_tickets_category ON tickets (category);
+CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON tickets (created_at);
+"""
+
+
+# Ticket Store - Embedded SQLite storage for processed tickets
+class TicketStore:
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        with closing(self._connect()) as conn:
+            # WAL mode lets the dashboard read while a processing run writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # One short-lived connection per operation, safe across Flask threads
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _to_db_value(value):
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return None
+        if isinstance(value, pd.Timestamp):
+            return value.strftime('%Y-%m-%d %H:%M:%S')
+        if hasattr(value, 'item'):
+            # Convert numpy scalars to plain Python values
+            return value.item()
+        return value
+
+    def _to_db_row(self, ticket):
+        return tuple(self._to_db_value(ticket.get(column)) for column in COLUMNS)
+
+    @staticmethod
+    def _where(status=None, priority=None, category=None):
+        # Build a WHERE clause on the indexed filter columns
+        filters = {'status': status, 'priority': priority, 'category': category}
+        clauses = [f"{col} = ?" for col, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        if not clauses:
+            return "", params
+        return " WHERE " + " AND ".join(clauses), params
+
+    def upsert_ticket(self, ticket):
+        # Insert a single ticket or update it if the Ticket ID already exists
+        return self.upsert_tickets([ticket])
+
+    def upsert_tickets(self, tickets, prune=False):
+        # Insert or update many tickets in a single transaction. Tickets
+        # without a Ticket ID cannot be upserted and are skipped. With
+        # prune=True, tickets missing from this batch are deleted in the
+        # same transaction, so the store holds exactly the latest run.
+        db_columns = list(COLUMNS.values())
+        updates = ', '.join(f"{col} = excluded.{col}" for col in db_columns[1:])
+        sql = (
+            f"INSERT INTO tickets ({', '.join(db_columns)}) "
+            f"VALUES ({', '.join('?' for _ in db_columns)}) "
+            f"ON CONFLICT(ticket_id) DO UPDATE SET {updates}"
+        )
+        rows = [self._to_db_row(ticket) for ticket in tickets]
+        rows = [row for row in rows if row[0] is not None]
+        with closing(self._connect()) as conn:
+            with conn:
+                if prune:
+                    conn.execute("CREATE TEMP TABLE batch_ids (ticket_id PRIMARY KEY)")
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO batch_ids VALUES (?)",
+                        [(row[0],) for row in rows],
+                    )
+                    conn.execute(
+                        "DELETE FROM tickets WHERE ticket_id NOT IN "
+                        "(SELECT ticket_id FROM batch_ids)"
+                    )
+                    conn.execute("DROP TABLE batch_ids")
+                conn.executemany(sql, rows)
+        return len(rows)
+
+    def upsert_dataframe(self, data, prune=False):
+        return self.upsert_tickets(data.to_dict('records'), prune=prune)
+
+    def query_tickets(self, status=None, priority=None, category=None):
+        # Fetch tickets, optionally filtered on indexed columns
+        where, params = self._where(status, priority, category)
+        sql = f"SELECT {', '.join(COLUMNS.values())} FROM tickets{where} ORDER BY created_at"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            {name: row[col] for name, col in COLUMNS.items()}
+            for row in rows
+        ]
+
+    def count_by(self, column, status=None, priority=None, category=None):
+        # Aggregate ticket counts grouped by an indexed column, as a list of
+        # {"value", "count"} pairs ordered from most to least common
+        if column not in INDEXED_COLUMNS:
+            raise ValueError(f"Cannot group tickets by '{column}'")
+        db_column = INDEXED_COLUMNS[column]
+        where, params = self._where(status, priority, category)
+        sql = (
+            f"SELECT COALESCE({db_column}, ?) AS value, COUNT(*) AS count "
+            f"FROM tickets{where} GROUP BY value ORDER BY count DESC, value"
+        )
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, [UNKNOWN_LABEL] + params).fetchall()
+        return [{"value": row['value'], "count": row['count']} for row in rows]
+
+    def count(self, status=None, priority=None, category=None):
+        where, params = self._where(status, priority, category)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM tickets{where}", params).fetchone()[0]